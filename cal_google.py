@@ -2,6 +2,7 @@
 import sys
 import os
 import calendar
+from collections import defaultdict
 
 picdir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'pic')
 libdir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'lib')
@@ -9,25 +10,54 @@ if os.path.exists(libdir):
     sys.path.append(libdir)
 
 import logging
-from datetime import datetime
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from waveshare_epd import epd7in5b_V2
 import time
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 import json
 
+# Google API 클라이언트 라이브러리는 import가 무거우므로 (Pi Zero에서 수백 ms)
+# 사용하는 함수 안에서 import -> e-paper 초기화와 겹쳐서 진행됨
+
 
 # Google Calendar API 설정
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 CREDENTIALS_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'credentials')
+BATCH_LIMIT = 50  # Calendar API batch 요청당 최대 호출 수
+MAX_EVENTS_PER_DAY = 3  # 날짜 칸에 표시할 최대 일정 수
+FALLBACK_WORKERS = 8  # batch 실패 시 개별 요청 동시 실행 수
+# 만료 5분 전부터 refresh. google-auth의 REFRESH_THRESHOLD(3분 45초)보다 커야 함:
+# 더 작으면 그 사이 구간에서 AuthorizedHttp가 요청 중에 몰래 refresh하고 새 토큰은 저장되지 않음
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# partial response: 실제로 쓰는 필드만 요청 (id/status/nextSyncToken은 증분 동기화용)
+EVENT_FIELDS = 'nextPageToken,nextSyncToken,items(id,status,start/dateTime,start/date,summary)'
+CALENDAR_LIST_FIELDS = 'etag,items(id,selected,deleted,hidden,accessRole)'
+CALENDAR_FILTER_VERSION = 2  # 필터 규칙이 바뀌면 올림 -> ETag 캐시에 남은 이전 결과를 쓰지 않음
+EVENTS_CACHE_PATH = os.path.join(CREDENTIALS_DIR, 'events_cache.json')
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), '.httpcache')
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600  # 초. pageToken/syncToken URL마다 파일이 생기므로 오래된 것은 삭제
+
+
+def _token_usable(creds):
+    """access token이 만료까지 충분히 남았으면 refresh 없이 사용"""
+    if not creds or not creds.token:
+        return False
+    if creds.expiry is None:
+        return True
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # creds.expiry는 naive UTC
+    return creds.expiry - now > TOKEN_REFRESH_MARGIN
 
 
 def get_google_credentials():
     """OAuth2 인증 처리 및 credentials 반환"""
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+
     token_path = os.path.join(CREDENTIALS_DIR, 'token.json')
     config_path = os.path.join(CREDENTIALS_DIR, 'oauth_config.json')
 
@@ -37,9 +67,11 @@ def get_google_credentials():
     if os.path.exists(token_path):
         creds = Credentials.from_authorized_user_file(token_path, SCOPES)
 
-    # 유효한 credentials가 없으면 새로 인증
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+    old_token = creds.token if creds else None
+
+    # 만료가 임박했을 때만 refresh, refresh token도 없으면 새로 인증
+    if not _token_usable(creds):
+        if creds and creds.refresh_token:
             creds.refresh(Request())
         else:
             # oauth_config.json에서 client_id, client_secret 읽기
@@ -74,18 +106,80 @@ def get_google_credentials():
             else:
                 creds = flow.run_local_server(port=0)
 
-        # 토큰 저장
+    # 토큰이 바뀐 경우에만 저장
+    if creds.token != old_token:
         with open(token_path, 'w') as token:
             token.write(creds.to_json())
 
     return creds
 
 
+def _visible_calendar_ids(items):
+    """calendarList 항목 중 실제로 그릴 캘린더 id
+
+    calendarList는 selected가 false이면 필드 자체를 생략하므로 없으면 선택 안 됨으로 취급
+    (pi_calendar._calendar_ids와 같은 기준). 숨김/삭제/free-busy 전용 캘린더도 제외.
+    """
+    return [
+        cal['id'] for cal in items
+        if cal.get('selected')
+        and not cal.get('deleted')
+        and not cal.get('hidden')
+        and cal.get('accessRole') != 'freeBusyReader'
+    ]
+
+
+def _prune_http_cache():
+    """httplib2 FileCache는 URL마다 파일 하나라 cron으로 돌리면 끝없이 쌓임 -> mtime 기준으로 정리"""
+    cutoff = time.time() - HTTP_CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(HTTP_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _load_events_cache():
+    """calendarList ETag + 캘린더별 sync token/일정 캐시 로드 (없거나 깨졌으면 빈 캐시)"""
+    try:
+        with open(EVENTS_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_events_cache(cache):
+    tmp = EVENTS_CACHE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp, EVENTS_CACHE_PATH)
+
+
+def _is_not_modified(exception):
+    from googleapiclient.errors import HttpError
+
+    return isinstance(exception, HttpError) and exception.resp.status == 304
+
+
 def get_google_calendar_events(year, month):
     """Google Calendar에서 해당 월의 일정을 가져옴"""
     try:
+        from googleapiclient.discovery import build
+        from googleapiclient.errors import HttpError
+        from google_auth_httplib2 import AuthorizedHttp
+        import httplib2
+
         creds = get_google_credentials()
-        service = build('calendar', 'v3', credentials=creds)
+        # keep-alive 연결 하나를 모든 요청이 공유 (요청마다 TLS handshake 방지)
+        _prune_http_cache()
+        http = AuthorizedHttp(creds, http=httplib2.Http(cache=HTTP_CACHE_DIR))
+        # discovery 문서는 라이브러리에 포함된 사본 사용 (매 실행 HTTPS 요청 제거)
+        service = build('calendar', 'v3', http=http, cache_discovery=False, static_discovery=True)
 
         # 해당 월의 시작/끝 날짜
         start_date = f"{year}-{month:02d}-01T00:00:00Z"
@@ -94,32 +188,151 @@ def get_google_calendar_events(year, month):
         else:
             end_date = f"{year}-{month+1:02d}-01T00:00:00Z"
 
-        events_by_day = {}
-
-        # 모든 캘린더 목록 가져오기
-        calendar_list = service.calendarList().list().execute()
-
-        for cal in calendar_list.get('items', []):
-            cal_id = cal['id']
-            events = service.events().list(
+        cache = _load_events_cache()
+        cache.setdefault('events', {})
+        month_key = f"{year}-{month:02d}"
+
+        def _cached_entry(cal_id):
+            # sync token이 있는 캐시만 증분 동기화에 사용
+            entry = cache['events'].get(f"{cal_id}|{month_key}")
+            return entry if entry and entry.get('sync_token') else None
+
+        def _list_events(cal_id, page_token=None):
+            cached = _cached_entry(cal_id)
+            if cached:
+                # 증분 동기화: 지난 실행 이후 바뀐 일정만 받음
+                # (syncToken은 timeMin/timeMax/orderBy와 함께 쓸 수 없음)
+                return service.events().list(
+                    calendarId=cal_id,
+                    syncToken=cached['sync_token'],
+                    singleEvents=True,
+                    maxResults=2500,
+                    pageToken=page_token,
+                    fields=EVENT_FIELDS
+                )
+            return service.events().list(
                 calendarId=cal_id,
                 timeMin=start_date,
                 timeMax=end_date,
                 singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            for event in events.get('items', []):
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                day = int(start[8:10])  # YYYY-MM-DD에서 일 추출
-                title = event.get('summary', 'No Title')[:15]  # 15자로 제한
-
-                if day not in events_by_day:
-                    events_by_day[day] = []
-                if title not in events_by_day[day]:  # 중복 방지
-                    events_by_day[day].append(title)
-
-        return events_by_day
+                orderBy='startTime',
+                maxResults=2500,
+                pageToken=page_token,
+                fields=EVENT_FIELDS
+            )
+
+        def _all_pages(cal_id, response):
+            # nextPageToken이 있으면 나머지 페이지도 이어서 가져옴 (잘림 방지)
+            page = response
+            while page.get('nextPageToken'):
+                page = _list_events(cal_id, page_token=page['nextPageToken']).execute()
+                response['items'] = response.get('items', []) + page.get('items', [])
+            response['nextSyncToken'] = page.get('nextSyncToken')  # 마지막 페이지에만 있음
+            return response
+
+        def _apply_events(events, response):
+            # 전체 목록/변경분을 event id 기준으로 반영: {event_id: [start, title]}
+            for event in response.get('items', []):
+                start = event.get('start') or {}
+                raw = start.get('dateTime') or start.get('date')
+                if event.get('status') == 'cancelled' or not raw or raw[:7] != month_key:
+                    events.pop(event['id'], None)
+                else:
+                    events[event['id']] = [raw, event.get('summary', 'No Title')[:15]]  # 15자로 제한
+            return events
+
+        def _is_gone(exception):
+            return isinstance(exception, HttpError) and exception.resp.status == 410
+
+        # EPAPER_CAL_IDS가 있으면 그 캘린더만 사용 (calendarList 요청 생략)
+        cal_ids = [c.strip() for c in os.environ.get('EPAPER_CAL_IDS', '').split(',') if c.strip()]
+
+        # 캘린더 목록 가져오기 (ETag가 같으면 304 -> 캐시 사용)
+        if not cal_ids:
+            request = service.calendarList().list(fields=CALENDAR_LIST_FIELDS)
+            cached_list = cache.get('calendar_list')
+            if cached_list and cached_list.get('etag') and cached_list.get('filter') == CALENDAR_FILTER_VERSION:
+                request.headers['If-None-Match'] = cached_list['etag']
+            try:
+                calendar_list = request.execute()
+                cal_ids = _visible_calendar_ids(calendar_list.get('items', []))
+                cache['calendar_list'] = {
+                    'etag': calendar_list.get('etag'),
+                    'ids': cal_ids,
+                    'filter': CALENDAR_FILTER_VERSION,
+                }
+            except HttpError as e:
+                if not _is_not_modified(e):
+                    raise
+                cal_ids = cached_list['ids']
+
+        # 캘린더별 결과: {cal_id: {'sync_token': ..., 'events': {event_id: [start, title]}}}
+        results = {}
+
+        def _store(cal_id, response, exception):
+            if exception is None:
+                response = _all_pages(cal_id, response)
+                cached = _cached_entry(cal_id)
+                events = dict(cached['events']) if cached else {}
+                results[cal_id] = {
+                    'sync_token': response.get('nextSyncToken'),
+                    'events': _apply_events(events, response),
+                }
+                return True
+            if _is_gone(exception):
+                # sync token 만료 (410 Gone) -> 캐시를 버리고 전체 목록으로 다시 요청
+                cache['events'].pop(f"{cal_id}|{month_key}", None)
+            return False
+
+        # 캘린더별 events.list를 batch 요청 하나로 묶어서 전송 (왕복 N회 -> 1회)
+        def _collect(request_id, response, exception):
+            if not _store(request_id, response, exception):
+                logging.warning(f"batch 요청 실패 ({request_id}): {exception}")
+
+        for i in range(0, len(cal_ids), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_collect)
+            for cal_id in cal_ids[i:i + BATCH_LIMIT]:
+                batch.add(_list_events(cal_id), request_id=cal_id)
+            try:
+                batch.execute()
+            except HttpError as e:
+                logging.warning(f"batch 요청 실패, 개별 요청으로 재시도: {e}")
+
+        # batch에서 실패한 캘린더는 개별 요청으로 fallback
+        # (httplib2.Http는 thread-safe하지 않으므로 worker 스레드마다 연결을 따로 둠)
+        failed = [cal_id for cal_id in cal_ids if cal_id not in results]
+        if failed:
+            local = threading.local()
+
+            def _fetch(cal_id):
+                if not hasattr(local, 'http'):
+                    local.http = AuthorizedHttp(creds, http=httplib2.Http())
+                try:
+                    return cal_id, _list_events(cal_id).execute(http=local.http), None
+                except HttpError as e:
+                    return cal_id, None, e
+
+            with ThreadPoolExecutor(max_workers=min(FALLBACK_WORKERS, len(failed))) as executor:
+                for cal_id, response, exception in executor.map(_fetch, failed):
+                    if _store(cal_id, response, exception):
+                        continue
+                    if not _is_gone(exception):
+                        raise exception
+                    _store(cal_id, _list_events(cal_id).execute(), None)
+
+        # 이번 달 결과만 캐시에 남김 (지난 달/삭제된 캘린더 정리)
+        cache['events'] = {f"{cal_id}|{month_key}": results[cal_id] for cal_id in cal_ids}
+        _save_events_cache(cache)
+
+        # dict를 순서 있는 set으로 사용: O(1) 중복 체크 + 시작 시간 순서 유지
+        events_by_day = defaultdict(dict)
+        for cal_id in cal_ids:
+            for raw, title in sorted(results[cal_id]['events'].values()):
+                day = (ord(raw[8]) - 48) * 10 + (ord(raw[9]) - 48)  # YYYY-MM-DD에서 일 추출
+                events_by_day[day][title] = None
+
+        # 셀에는 최대 3개까지만 표시
+        return {day: list(titles)[:MAX_EVENTS_PER_DAY] for day, titles in events_by_day.items()}
 
     except FileNotFoundError as e:
         logging.warning(f"OAuth 설정 파일 오류: {e}")
@@ -128,6 +341,41 @@ def get_google_calendar_events(year, month):
         logging.error(f"Google Calendar 일정 가져오기 실패: {e}")
         return {}
 
+def _getbuffer(image):
+    """epd.getbuffer()와 같은 버퍼(1 = 검정)를 픽셀 루프 없이 NumPy packbits로 생성"""
+    pixels = np.asarray(image.convert('1'), dtype=bool)  # True = 흰색
+    # display()가 검정 버퍼를 제자리에서 뒤집으므로 bytearray로 반환
+    return bytearray(np.packbits(~pixels, axis=1).tobytes())
+
+
+def _read_last_frame_hash():
+    try:
+        with open(LAST_FRAME_PATH, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_last_frame_hash(frame_hash):
+    try:
+        os.makedirs(os.path.dirname(LAST_FRAME_PATH), exist_ok=True)
+        tmp = LAST_FRAME_PATH + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(frame_hash)
+        os.replace(tmp, LAST_FRAME_PATH)
+    except OSError as e:
+        logging.warning(f"프레임 지문 저장 실패: {e}")
+
+
+def _invalidate_last_frame_hash():
+    # Clear()로 화면을 지우면 저장된 지문은 더 이상 패널 내용과 맞지 않음
+    try:
+        os.remove(LAST_FRAME_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning(f"프레임 지문 삭제 실패: {e}")
+
 logging.basicConfig(level=logging.DEBUG)
 
 # 현재 날짜 기준으로 연도와 월 설정
@@ -135,24 +383,30 @@ now = datetime.now()
 YEAR = now.year
 MONTH = now.month
 WEEKDAYS = ['일', '월', '화', '수', '목', '금', '토']
+FONT_WEEKDAY_SIZE = 18
+FONT_DAY_SIZE = 20
+FONT_SCHEDULE_SIZE = 12
+FONT_PATH = os.path.join(picdir, 'Font.ttc')
+SKELETON_CACHE_DIR = os.path.join(picdir, '_cache')
+# 마지막으로 표시한 프레임 지문: 같은 패널을 쓰는 pi_calendar.py와 같은 파일/형식을 공유
+# (/tmp는 재부팅 때 지워지지만 패널 화면은 남아 있으므로 cache/ 아래에 둠)
+LAST_FRAME_PATH = os.environ.get('PI_CAL_LAST_FRAME') or os.path.join(
+    os.environ.get('PI_CAL_CACHEDIR') or os.path.join(os.path.dirname(os.path.realpath(__file__)), 'cache'),
+    'last_frame.hash',
+)
 
 try:
     logging.info(f"Calendar Demo - {YEAR}년 {MONTH}월")
 
     epd = epd7in5b_V2.EPD()
-    logging.info("init and Clear")
-    epd.init()
-    epd.Clear()
-
-    font_weekday = ImageFont.truetype(os.path.join(picdir, 'Font.ttc'), 18)
-    font_day = ImageFont.truetype(os.path.join(picdir, 'Font.ttc'), 20)
-    font_schedule = ImageFont.truetype(os.path.join(picdir, 'Font.ttc'), 12)
+    logging.info("init")
+    # init은 SPI 대기가 있으므로 백그라운드에서 진행하고,
+    # 그동안 메인 스레드에서 Google 라이브러리 import/그리기/일정 조회를 처리
+    # (Clear는 화면이 바뀔 때만 하므로 프레임 비교 뒤로 미룸)
+    epd_executor = ThreadPoolExecutor(max_workers=1)
+    epd_ready = epd_executor.submit(epd.init)
 
-    Himage = Image.new('1', (epd.width, epd.height), 255)
-    Rimage = Image.new('1', (epd.width, epd.height), 255)
-
-    draw_black = ImageDraw.Draw(Himage)
-    draw_red = ImageDraw.Draw(Rimage)
+    font_schedule = ImageFont.truetype(FONT_PATH, FONT_SCHEDULE_SIZE)
 
     margin_x = 20
     margin_y = 5
@@ -161,62 +415,123 @@ try:
     weekday_height = 25
 
     weekday_y = margin_y
-    for i, day in enumerate(WEEKDAYS):
-        x = margin_x + i * cell_width + (cell_width - draw_black.textbbox((0, 0), day, font=font_weekday)[2]) // 2
-        if i == 0 or i == 6:  # 일요일, 토요일 빨간색
-            draw_red.text((x, weekday_y), day, font=font_weekday, fill=0)
-        else:
-            draw_black.text((x, weekday_y), day, font=font_weekday, fill=0)
-
     line_y = weekday_y + weekday_height
-    draw_black.line((margin_x, line_y, epd.width - margin_x, line_y), fill=0, width=2)
-
-    cal = calendar.Calendar(firstweekday=6)
-    month_days = cal.monthdayscalendar(YEAR, MONTH)
-
-    start_y = line_y + 2
-    for week_num, week in enumerate(month_days):
-        for day_num, day in enumerate(week):
-            if day != 0:
-                day_str = str(day)
-
-                # 날짜를 셀 왼쪽 상단에 배치 (스케줄 공간 확보)
-                x = margin_x + day_num * cell_width + 3
-                y = start_y + week_num * cell_height + 2
 
-                if day_num == 0 or day_num == 6:  # 일요일, 토요일 빨간색
-                    draw_red.text((x, y), day_str, font=font_day, fill=0)
-                else:
-                    draw_black.text((x, y), day_str, font=font_day, fill=0)
-
-    grid_start_y = line_y
-    grid_end_y = line_y + len(month_days) * cell_height
+    # 일요일 시작 달력: 1일의 칸 위치(offset)만 알면 나머지는 연속 배치
+    first_weekday, days_in_month = calendar.monthrange(YEAR, MONTH)  # 월요일 = 0
+    offset = (first_weekday + 1) % 7
+    weeks = -(-(offset + days_in_month) // 7)
+    grid = np.zeros(weeks * 7, dtype=np.int8)
+    grid[offset:offset + days_in_month] = np.arange(1, days_in_month + 1)
+    month_days = grid.reshape(weeks, 7).tolist()
+
+    # 요일/격자/날짜 숫자는 (해상도, 연월, 배치 값, 폰트)가 같으면 항상 같으므로 PNG로 캐시.
+    # 그림에 영향을 주는 값은 모두 지문에 넣어야 값이 바뀌었을 때 예전 캐시를 쓰지 않음
+    fingerprint = hashlib.sha1(
+        repr((
+            epd.width, epd.height, YEAR, MONTH,
+            WEEKDAYS, margin_x, margin_y, cell_height, weekday_height,
+            FONT_PATH, FONT_WEEKDAY_SIZE, FONT_DAY_SIZE,
+        )).encode()
+    ).hexdigest()[:16]
+    cache_black = os.path.join(SKELETON_CACHE_DIR, f'cal_{fingerprint}_H.png')
+    cache_red = os.path.join(SKELETON_CACHE_DIR, f'cal_{fingerprint}_R.png')
+
+    if os.path.exists(cache_black) and os.path.exists(cache_red):
+        Himage = Image.open(cache_black).convert('1')
+        Rimage = Image.open(cache_red).convert('1')
+        draw_black = ImageDraw.Draw(Himage)
+    else:
+        font_weekday = ImageFont.truetype(FONT_PATH, FONT_WEEKDAY_SIZE)
+        font_day = ImageFont.truetype(FONT_PATH, FONT_DAY_SIZE)
+
+        Himage = Image.new('1', (epd.width, epd.height), 255)
+        Rimage = Image.new('1', (epd.width, epd.height), 255)
+
+        draw_black = ImageDraw.Draw(Himage)
+        draw_red = ImageDraw.Draw(Rimage)
+
+        for i, day in enumerate(WEEKDAYS):
+            x = margin_x + i * cell_width + (cell_width - draw_black.textbbox((0, 0), day, font=font_weekday)[2]) // 2
+            if i == 0 or i == 6:  # 일요일, 토요일 빨간색
+                draw_red.text((x, weekday_y), day, font=font_weekday, fill=0)
+            else:
+                draw_black.text((x, weekday_y), day, font=font_weekday, fill=0)
 
-    for i in range(8):
-        x = margin_x + i * cell_width
-        draw_black.line((x, grid_start_y, x, grid_end_y), fill=0)
+        draw_black.line((margin_x, line_y, epd.width - margin_x, line_y), fill=0, width=2)
 
-    for i in range(len(month_days) + 1):
-        y = line_y + i * cell_height
-        draw_black.line((margin_x, y, epd.width - margin_x, y), fill=0)
+        start_y = line_y + 2
+        for week_num, week in enumerate(month_days):
+            for day_num, day in enumerate(week):
+                if day != 0:
+                    day_str = str(day)
+
+                    # 날짜를 셀 왼쪽 상단에 배치 (스케줄 공간 확보)
+                    x = margin_x + day_num * cell_width + 3
+                    y = start_y + week_num * cell_height + 2
+
+                    if day_num == 0 or day_num == 6:  # 일요일, 토요일 빨간색
+                        draw_red.text((x, y), day_str, font=font_day, fill=0)
+                    else:
+                        draw_black.text((x, y), day_str, font=font_day, fill=0)
+
+        grid_start_y = line_y
+        grid_end_y = line_y + len(month_days) * cell_height
+
+        # 격자선은 선마다 draw.line을 부르지 않고 NumPy 배열에 한 번에 기록
+        pixels = np.array(Himage)  # bool, True = 흰색
+        xs = margin_x + np.arange(8) * cell_width
+        ys = line_y + np.arange(len(month_days) + 1) * cell_height
+        pixels[grid_start_y:grid_end_y + 1, xs[xs < epd.width]] = False
+        pixels[ys[ys < epd.height], margin_x:epd.width - margin_x + 1] = False
+        Himage = Image.fromarray(pixels)
+        draw_black = ImageDraw.Draw(Himage)
+
+        try:
+            os.makedirs(SKELETON_CACHE_DIR, exist_ok=True)
+            Himage.save(cache_black)
+            Rimage.save(cache_red)
+        except OSError as e:
+            logging.warning(f"달력 배경 캐시 저장 실패: {e}")
 
     # Google Calendar에서 일정 가져오기
     schedules = get_google_calendar_events(YEAR, MONTH)
 
+    # 날짜 -> (주, 요일) 위치
+    day_pos = {day: divmod(offset + day - 1, 7) for day in range(1, days_in_month + 1)}
+
     # 스케줄 그리기
     for day, texts in schedules.items():
-        for week_num, week in enumerate(month_days):
-            if day in week:
-                day_num = week.index(day)
-                x = margin_x + day_num * cell_width + 3
-                y = line_y + week_num * cell_height + 24
-                for i, text in enumerate(texts[:3]):  # 최대 3개까지 표시
-                    draw_black.text((x, y + i * 14), text, font=font_schedule, fill=0)
-                break
-
-    logging.info("Displaying calendar...")
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Rimage))
-    time.sleep(2)
+        if day not in day_pos:
+            continue
+        week_num, day_num = day_pos[day]
+        x = margin_x + day_num * cell_width + 3
+        y = line_y + week_num * cell_height + 24
+        for i, text in enumerate(texts):
+            draw_black.text((x, y + i * 14), text, font=font_schedule, fill=0)
+
+    buf_black = _getbuffer(Himage)
+    buf_red = _getbuffer(Rimage)
+    # display()가 buf_black을 뒤집기 전에 지문 계산.
+    # pi_calendar.py와 같은 형식(검정 면은 패널 RAM 극성, 1 = 흰색)으로 계산해야 지문 파일을 공유 가능
+    black_ram = np.invert(np.frombuffer(buf_black, dtype=np.uint8)).tobytes()
+    frame_hash = hashlib.blake2b(black_ram + buf_red, digest_size=16).hexdigest()
+
+    epd_ready.result()  # init 중 발생한 예외는 여기서 다시 발생
+    epd_executor.shutdown()
+
+    if frame_hash == _read_last_frame_hash():
+        # 지난번과 같은 화면이면 SPI 전송/전체 갱신(수 초)을 생략
+        logging.info("Calendar unchanged, skip display")
+    else:
+        logging.info("Clear")
+        _invalidate_last_frame_hash()
+        epd.Clear()
+
+        logging.info("Displaying calendar...")
+        epd.display(buf_black, buf_red)
+        time.sleep(2)
+        _write_last_frame_hash(frame_hash)
 
     logging.info("Goto Sleep...")
     epd.sleep()
@@ -18,18 +18,38 @@ E-paper:
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import calendar as py_calendar
+import hashlib
 import json
 import re
 import logging
 import os
+import random
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator
+from urllib.parse import quote
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 try:
     from gpiozero import Button  # type: ignore
 except Exception:  # pragma: no cover
@@ -41,9 +61,7 @@ except Exception:  # pragma: no cover
     RGPIO = None  # type: ignore
 
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from google.auth.transport.requests import AuthorizedSession, Request
 
 
 logging.basicConfig(level=logging.INFO)
@@ -51,6 +69,7 @@ logging.basicConfig(level=logging.INFO)
 # Local paths (repo-relative)
 BASEDIR = os.path.dirname(os.path.realpath(__file__))
 PICDIR = os.path.join(BASEDIR, "pic")
+FONT_PATH = os.path.join(PICDIR, "Font.ttc")
 LIBDIR = os.path.join(BASEDIR, "lib")
 CREDENTIALS_DIR = os.path.join(BASEDIR, "credentials")
 
@@ -59,10 +78,43 @@ if os.path.exists(LIBDIR):
 
 # NOTE: Waveshare EPD library touches GPIO at import time.
 # To allow cache-update to run while a long-running button listener holds GPIO,
-# we import it lazily inside _epd_init().
+# we import it lazily inside _epd().
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
+# Calendar v3 REST endpoints are called directly (no discovery/client build);
+# per-calendar events.list requests run concurrently on one keep-alive pool.
+CALENDAR_API = "https://www.googleapis.com/calendar/v3"
+CALENDAR_FETCH_WORKERS = 4
+
+# calendarList body + ETag, revalidated with If-None-Match on each fetch
+CALENDAR_LIST_CACHE_PATH = os.path.join(CREDENTIALS_DIR, "callist.json")
+
+# Partial response: only the event fields the renderers read
+EVENT_FIELDS = "items(summary,start(dateTime,date)),nextPageToken"
+# Month cells keep this many events per day (3 are drawn; one spare in case a
+# label cleans down to nothing)
+MONTH_EVENTS_PER_DAY = 4
+
+# events.list page size (API max 2500); with the fields mask pages stay small,
+# so one page per calendar covers even long cache_update ranges.
+EVENTS_PAGE_SIZE = 2500
+
+# In-process caches for long-running callers (server / button listener):
+# credentials keyed on token.json mtime, and the authorized session built for
+# them (which also keeps its TLS connections alive between renders).
+_CREDS_CACHE: tuple[float, Credentials] | None = None
+_SESSION_CACHE: tuple[Credentials, AuthorizedSession] | None = None
+
+# Refresh the access token once it has less than this many seconds left, so no
+# request waits on the token endpoint. Long-lived callers (server, button
+# listener) set BACKGROUND_TOKEN_REFRESH to do it on a daemon thread; one-shot
+# CLI runs refresh inline, since exiting could kill the thread mid-refresh.
+TOKEN_PREFRESH_SECONDS = 300
+BACKGROUND_TOKEN_REFRESH = False
+_TOKEN_REFRESHING = False
+_TOKEN_REFRESH_LOCK = threading.Lock()
+
 SEOUL_LAT = 37.5665
 SEOUL_LON = 126.9780
 
@@ -82,23 +134,215 @@ CACHEDIR = os.environ.get("PI_CAL_CACHEDIR") or os.path.join(BASEDIR, "cache")
 CACHE_CAL_PATH = os.environ.get("PI_CAL_CACHE_CAL", os.path.join(CACHEDIR, "calendar_week.json"))
 CACHE_WEATHER_PATH = os.environ.get("PI_CAL_CACHE_WEATHER", os.path.join(CACHEDIR, "weather_5d.json"))
 
+# Raw OpenWeather forecast response, reused while younger than WEATHER_CACHE_TTL seconds
+CACHE_FORECAST_PATH = os.environ.get("PI_CAL_CACHE_FORECAST", os.path.join(CACHEDIR, "forecast_5d_3h.json"))
+WEATHER_CACHE_TTL = int(os.environ.get("PI_CAL_WEATHER_TTL", "600"))
+# Same entry kept in memory (plus fetch time "t") so repeat renders skip the file read
+_FORECAST_MEMO: dict = {}
+
+# Keep-alive session for plain HTTPS calls (OpenWeather, OAuth device flow),
+# reused across calls in one process. Idempotent requests retry transient
+# 429/5xx with backoff; POSTs are never retried by urllib3's default policy.
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "pi-calendar/0.1"})
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
+# Hash of the frame currently on the panel, used to skip refreshing with an
+# identical frame. cal_google.py shares the same file and hash format. Other
+# processes (cron, button listener, server) draw too, so the hash is read from
+# disk on every show rather than remembered in memory.
+LAST_FRAME_HASH_PATH = os.environ.get("PI_CAL_LAST_FRAME", os.path.join(CACHEDIR, "last_frame.hash"))
+
 # Button event log (persisted)
 BUTTON_LOG_PATH = os.environ.get("PI_CAL_BUTTON_LOG", os.path.join(CACHEDIR, "button_events.log"))
 BUTTON_BACKEND = (os.environ.get("PI_CAL_BUTTON_BACKEND") or "").strip().lower()  # e.g. 'rpigpio'|'gpiozero'
 
 
+@lru_cache(maxsize=16)
 def _font(path: str, size: int):
     return ImageFont.truetype(path, size)
 
 
-def _epd_init():
-    # Lazy import to avoid GPIO conflicts for non-rendering commands (e.g. cache-update)
-    from waveshare_epd import epd7in5b_V2  # type: ignore
+# One driver object per process. The first session does the full Clear() wipe;
+# later sessions (e.g. several views rendered back-to-back) only wake the panel.
+_EPD = None
+_EPD_CLEARED = False
+
 
-    epd = epd7in5b_V2.EPD()
+def _epd():
+    """Return the process-wide EPD driver (no panel I/O; width/height are usable)."""
+    global _EPD
+    if _EPD is None:
+        # Lazy import to avoid GPIO conflicts for non-rendering commands (e.g. cache-update)
+        from waveshare_epd import epd7in5b_V2  # type: ignore
+
+        _EPD = epd7in5b_V2.EPD()
+    return _EPD
+
+
+@contextmanager
+def _epd_session(clear: bool | None = None):
+    """Wake the panel for one update and put it back into deep sleep on exit.
+
+    clear=None wipes only on the first session in this process. sleep() releases
+    the GPIO/SPI module, so every session still needs init().
+    """
+    global _EPD_CLEARED
+    epd = _epd()
     epd.init()
-    epd.Clear()
-    return epd
+    do_clear = (not _EPD_CLEARED) if clear is None else clear
+    if do_clear:
+        _invalidate_last_frame_hash()  # the panel no longer shows that frame
+        epd.Clear()
+        _EPD_CLEARED = True
+    try:
+        yield epd
+    finally:
+        epd.sleep()
+
+
+def _as_mono(image: Image.Image) -> Image.Image:
+    """`image` in mode "1"; convert() would copy the frame even when it already is."""
+    return image if image.mode == "1" else image.convert("1")
+
+
+def _getbuffer_fast(image) -> bytes:
+    """Same bytes as epd.getbuffer() for a panel-sized image (1 = ink), packed by NumPy.
+
+    The driver XORs every byte in a Python loop; here the whole frame is inverted
+    and bit-packed row-wise in one call.
+    """
+    px = np.asarray(_as_mono(image), dtype=bool)  # True = white
+    return np.packbits(~px, axis=1).tobytes()
+
+
+def _epd_write_planes(epd, black: bytes, red: bytes) -> None:
+    """Load both RAM planes and refresh, like epd.display() minus its per-byte loop.
+
+    display() XORs the getbuffer() output back to panel polarity one byte at a
+    time. Here `black` is already in black-RAM polarity (1 = white, i.e. PIL's
+    raw mode "1" bytes) and `red` in red-RAM polarity (1 = red).
+    """
+    epd.send_command(0x10)
+    epd.send_data2(black)
+    epd.send_command(0x13)
+    epd.send_data2(red)
+    epd.send_command(0x12)  # display refresh
+    time.sleep(0.1)
+    epd.ReadBusy()
+
+
+def _epd_show(black: Image.Image, red: Image.Image | None = None) -> None:
+    """Send one frame to the panel. Without `red`, the black image goes to both
+    planes (as the black-only views always did) and is packed only once.
+    """
+    black_raw = _as_mono(black).tobytes()  # 1 = white: black RAM as-is
+    if red is None:
+        red_raw = np.invert(np.frombuffer(black_raw, dtype=np.uint8)).tobytes()
+    else:
+        red_raw = _getbuffer_fast(red)
+
+    # A full refresh takes seconds; skip it (and waking the panel) if the
+    # panel already shows exactly this frame.
+    h = hashlib.blake2b(black_raw + red_raw, digest_size=16).hexdigest()
+    if h == _last_frame_hash():
+        logging.info("Frame unchanged; skipping display refresh")
+        return
+
+    with _epd_session() as epd:
+        # A write that fails partway leaves the panel half-drawn: drop the old
+        # hash first so a later request for that frame isn't skipped
+        _invalidate_last_frame_hash()
+        _epd_write_planes(epd, black_raw, red_raw)
+
+    _write_last_frame_hash(h)
+
+
+def _last_frame_hash() -> str:
+    try:
+        with open(LAST_FRAME_HASH_PATH, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _invalidate_last_frame_hash() -> None:
+    try:
+        os.remove(LAST_FRAME_HASH_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning("Last frame hash remove failed: %s", e)
+
+
+def _write_last_frame_hash(h: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(LAST_FRAME_HASH_PATH) or ".", exist_ok=True)
+        tmp = f"{LAST_FRAME_HASH_PATH}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(h)
+        os.replace(tmp, LAST_FRAME_HASH_PATH)
+    except OSError as e:
+        logging.warning("Last frame hash write failed: %s", e)
+
+
+def _save_credentials(creds: Credentials, token_path: str) -> None:
+    """Write token.json atomically (it holds the only refresh token) and cache it."""
+    global _CREDS_CACHE
+    tmp = f"{token_path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(creds.to_json())
+    os.replace(tmp, token_path)
+    _CREDS_CACHE = (os.path.getmtime(token_path), creds)
+
+
+def _prefresh_credentials(creds: Credentials, token_path: str) -> Credentials:
+    """Refresh a still-valid token ahead of expiry; return the credentials to use.
+
+    Inline unless BACKGROUND_TOKEN_REFRESH is set. The daemon thread refreshes a
+    copy, so sessions built on `creds` are never touched mid-request; the copy
+    replaces it through _CREDS_CACHE and _calendar_session picks it up on its
+    next call. At most one background refresh runs at a time; failures are
+    logged and left for the refresh-on-expiry in get_google_credentials.
+    """
+    global _TOKEN_REFRESHING
+    if not creds.refresh_token or creds.expiry is None:
+        return creds
+    # google-auth keeps expiry as naive UTC
+    left = (creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+    if left >= TOKEN_PREFRESH_SECONDS:
+        return creds
+    if not BACKGROUND_TOKEN_REFRESH:
+        creds.refresh(Request())
+        _save_credentials(creds, token_path)
+        return creds
+    with _TOKEN_REFRESH_LOCK:
+        if _TOKEN_REFRESHING:
+            return creds
+        _TOKEN_REFRESHING = True
+
+    def _run() -> None:
+        global _TOKEN_REFRESHING
+        try:
+            fresh = Credentials.from_authorized_user_info(json.loads(creds.to_json()), SCOPES)
+            fresh.refresh(Request())
+            _save_credentials(fresh, token_path)
+            logging.info("Google token refreshed ahead of expiry")
+        except Exception as e:
+            logging.warning("Background token refresh failed: %s", e)
+        finally:
+            with _TOKEN_REFRESH_LOCK:
+                _TOKEN_REFRESHING = False
+
+    threading.Thread(target=_run, name="token-refresh", daemon=True).start()
+    return creds
 
 
 def get_google_credentials(interactive: bool = False) -> Credentials:
@@ -107,18 +351,23 @@ def get_google_credentials(interactive: bool = False) -> Credentials:
     token_path = os.path.join(CREDENTIALS_DIR, "token.json")
     config_path = os.path.join(CREDENTIALS_DIR, "oauth_config.json")
 
+    global _CREDS_CACHE
     creds: Credentials | None = None
 
     if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+        mtime = os.path.getmtime(token_path)
+        if _CREDS_CACHE is not None and _CREDS_CACHE[0] == mtime:
+            creds = _CREDS_CACHE[1]
+        else:
+            creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+            _CREDS_CACHE = (mtime, creds)
 
     if creds and creds.valid:
-        return creds
+        return _prefresh_credentials(creds, token_path)
 
     if creds and creds.expired and creds.refresh_token:
         creds.refresh(Request())
-        with open(token_path, "w", encoding="utf-8") as f:
-            f.write(creds.to_json())
+        _save_credentials(creds, token_path)
         return creds
 
     if not interactive:
@@ -146,6 +395,9 @@ def get_google_credentials(interactive: bool = False) -> Credentials:
         }
     }
 
+    # Only the one-time `auth` command needs the OAuth flow (and oauthlib)
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
     auth_url, _state = flow.authorization_url(
         access_type="offline",
@@ -159,10 +411,7 @@ def get_google_credentials(interactive: bool = False) -> Credentials:
 
     flow.fetch_token(code=code)
     creds = flow.credentials
-
-    with open(token_path, "w", encoding="utf-8") as f:
-        f.write(creds.to_json())
-
+    _save_credentials(creds, token_path)
     return creds
 
 
@@ -170,81 +419,204 @@ def _to_rfc3339_z(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def get_google_calendar_events_range(
-    start: datetime, end: datetime
-) -> list[tuple[datetime, str]]:
-    """Return flat list of (start_datetime_local, title) between [start, end)."""
+def _calendar_session() -> AuthorizedSession:
+    """Authorized requests session for the current credentials, rebuilt only when they change.
+
+    AuthorizedSession refreshes the access token when it has expired or a call
+    returns 401.
+    """
+    global _SESSION_CACHE
     creds = get_google_credentials(interactive=False)
-    service = build("calendar", "v3", credentials=creds)
+    if _SESSION_CACHE is None or _SESSION_CACHE[0] is not creds:
+        session = AuthorizedSession(creds)
+        session.headers.update({"User-Agent": "pi-calendar/0.1"})
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=CALENDAR_FETCH_WORKERS),
+        )
+        _SESSION_CACHE = (creds, session)
+    return _SESSION_CACHE[1]
+
+
+def _calendar_get(
+    session: AuthorizedSession, path: str, params: dict | None = None, headers: dict | None = None
+) -> requests.Response:
+    return session.get(f"{CALENDAR_API}{path}", params=params, headers=headers, timeout=15)
+
+
+def _calendar_ids(session: AuthorizedSession) -> list[str]:
+    """Calendar ids to query: `calendar_allowlist` from oauth_config.json if set,
+    otherwise the calendars marked selected in the user's calendar list."""
+    config = _cache_read(os.path.join(CREDENTIALS_DIR, "oauth_config.json"))
+    allowlist = config.get("calendar_allowlist")
+    if allowlist:
+        return [str(x) for x in allowlist]
+
+    cached = _cache_read(CALENDAR_LIST_CACHE_PATH)
+    r = _calendar_get(
+        session,
+        "/users/me/calendarList",
+        params={"minAccessRole": "reader", "fields": "etag,items(id,selected)"},
+        headers={"If-None-Match": cached["etag"]} if cached.get("etag") else None,
+    )
+    if r.status_code == 304:
+        body = cached
+    else:
+        r.raise_for_status()
+        body = _json_loads(r.content)
+        try:
+            _cache_write(CALENDAR_LIST_CACHE_PATH, {"etag": body.get("etag"), "items": body.get("items", [])})
+        except Exception as e:
+            logging.warning("Calendar list cache write failed: %s", e)
 
-    time_min = _to_rfc3339_z(start)
-    time_max = _to_rfc3339_z(end)
+    items = body.get("items", [])
+    selected = [cal["id"] for cal in items if cal.get("selected")]
+    return selected or [cal["id"] for cal in items]
 
-    items: list[tuple[datetime, str]] = []
-
-    calendar_list = service.calendarList().list().execute()
-    for cal in calendar_list.get("items", []):
-        cal_id = cal["id"]
-        events = (
-            service.events()
-            .list(
-                calendarId=cal_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
 
-        for event in events.get("items", []):
-            title = (event.get("summary") or "No Title").strip()
+def _calendar_events(session: AuthorizedSession, cal_id: str, time_min: str, time_max: str) -> Iterator[dict]:
+    """Yield events.list items of one calendar in [time_min, time_max) in start order.
 
-            # dateTime => timed event; date => all-day
-            start_raw = event.get("start", {}).get("dateTime")
-            if start_raw:
-                try:
-                    dt = datetime.fromisoformat(start_raw.replace("Z", "+00:00")).astimezone()
-                except Exception:
-                    continue
-                label = f"{dt.strftime('%H:%M')} {title}"
-                items.append((dt, label))
-            else:
-                date_raw = event.get("start", {}).get("date")
-                if not date_raw:
-                    continue
-                # Treat all-day as local midnight
-                try:
-                    dt = datetime.fromisoformat(date_raw).replace(tzinfo=timezone.utc).astimezone()
-                except Exception:
-                    continue
-                label = f"(종일) {title}"
-                items.append((dt, label))
+    Pages are requested lazily via nextPageToken, so a consumer that stops
+    iterating also stops paging.
+    """
+    path = f"/calendars/{quote(cal_id, safe='')}/events"
+    params = {
+        "timeMin": time_min,
+        "timeMax": time_max,
+        "singleEvents": "true",
+        "orderBy": "startTime",
+        "fields": EVENT_FIELDS,
+        "maxResults": EVENTS_PAGE_SIZE,
+    }
+    while True:
+        r = _calendar_get(session, path, params=params)
+        r.raise_for_status()
+        body = _json_loads(r.content)
+        yield from body.get("items", [])
+        if not body.get("nextPageToken"):
+            return
+        params["pageToken"] = body["nextPageToken"]
+
+
+def _parse_event(event: dict) -> tuple[datetime, str] | None:
+    """(start_datetime_local, label) for one event resource, or None if it has no usable start."""
+    title = (event.get("summary") or "No Title").strip()
+
+    # dateTime => timed event; date => all-day
+    start_raw = event.get("start", {}).get("dateTime")
+    if start_raw:
+        try:
+            dt = datetime.fromisoformat(start_raw.replace("Z", "+00:00")).astimezone()
+        except Exception:
+            return None
+        return dt, f"{dt.strftime('%H:%M')} {title}"
+
+    date_raw = event.get("start", {}).get("date")
+    if not date_raw:
+        return None
+    # Treat all-day as local midnight
+    try:
+        dt = datetime.combine(date.fromisoformat(date_raw), datetime.min.time()).astimezone()
+    except Exception:
+        return None
+    return dt, f"(종일) {title}"
+
+
+def get_google_calendar_events_range(
+    start: datetime, end: datetime, per_day: int | None = None
+) -> list[tuple[datetime, str]]:
+    """Return flat list of (start_datetime_local, title) between [start, end).
 
-    # de-dupe and sort
-    uniq = list({(d.isoformat(), t): (d, t) for d, t in items}.values())
+    With `per_day`, at most that many events per local date are kept from each
+    calendar (the earliest, since results come in start order), and a calendar
+    stops paging once every date in the range is full.
+    """
+    session = _calendar_session()
+
+    time_min = _to_rfc3339_z(start)
+    time_max = _to_rfc3339_z(end)
+    first_date = start.date()
+    last_date = (end - timedelta(microseconds=1)).date()
+    n_dates = (last_date - first_date).days + 1
+
+    def _collect(cal_id: str) -> list[tuple[datetime, str]]:
+        out: list[tuple[datetime, str]] = []
+        per_date: dict[date, int] = {}
+        full = 0
+        for event in _calendar_events(session, cal_id, time_min, time_max):
+            parsed = _parse_event(event)
+            if parsed is None:
+                continue
+            if per_day is not None:
+                d = parsed[0].date()
+                n = per_date.get(d, 0)
+                if n >= per_day:
+                    continue
+                per_date[d] = n + 1
+                # Dates outside the window (multi-day events that began earlier)
+                # must not count towards the early stop
+                if n + 1 == per_day and first_date <= d <= last_date:
+                    full += 1
+            out.append(parsed)
+            if per_day is not None and full >= n_dates:
+                break  # every date is full: stop paging this calendar
+        return out
+
+    # One events.list GET per calendar, issued concurrently; the first failure is raised.
+    cal_ids = _calendar_ids(session)
+    with ThreadPoolExecutor(max_workers=max(1, min(CALENDAR_FETCH_WORKERS, len(cal_ids)))) as ex:
+        per_calendar = list(ex.map(_collect, cal_ids))
+
+    items = [x for events in per_calendar for x in events]
+
+    # de-dupe (datetime/str tuples are hashable as-is) and sort
+    seen: set[tuple[datetime, str]] = set()
+    uniq = [x for x in items if not (x in seen or seen.add(x))]
     uniq.sort(key=lambda x: x[0])
     return uniq
 
 
-def get_google_calendar_events(year: int, month: int) -> dict[int, list[str]]:
+def _month_range(year: int, month: int) -> tuple[datetime, datetime]:
     start = datetime(year, month, 1, tzinfo=timezone.utc).astimezone()
     if month == 12:
         end = datetime(year + 1, 1, 1, tzinfo=timezone.utc).astimezone()
     else:
         end = datetime(year, month + 1, 1, tzinfo=timezone.utc).astimezone()
+    return start, end
+
 
+def _events_by_day(items: list[tuple[datetime, str]]) -> dict[int, list[str]]:
+    """Group (start, label) pairs into {day_of_month: [short labels]} for the month view.
+
+    Keeps at most MONTH_EVENTS_PER_DAY unique labels per day; a cell shows 3 lines.
+    """
     events_by_day: dict[int, list[str]] = {}
-    for dt, label in get_google_calendar_events_range(start, end):
-        day = dt.day
+    for dt, label in items:
+        day_list = events_by_day.setdefault(dt.day, [])
+        if len(day_list) >= MONTH_EVENTS_PER_DAY:
+            continue
         title = label[:18]
-        events_by_day.setdefault(day, [])
-        if title not in events_by_day[day]:
-            events_by_day[day].append(title)
+        if title not in day_list:
+            day_list.append(title)
 
     return events_by_day
 
 
+def get_google_calendar_events(year: int, month: int) -> dict[int, list[str]]:
+    start, end = _month_range(year, month)
+    return _events_by_day(get_google_calendar_events_range(start, end, per_day=MONTH_EVENTS_PER_DAY))
+
+
+async def get_google_calendar_events_async(year: int, month: int) -> dict[int, list[str]]:
+    """Awaitable get_google_calendar_events for async callers (e.g. the HTTP server).
+
+    The blocking calendar requests run in a worker thread so the caller's
+    event loop keeps serving while it waits on the network.
+    """
+    return await asyncio.to_thread(get_google_calendar_events, year, month)
+
+
 
 
 def auth_device_flow():
@@ -266,7 +638,7 @@ def auth_device_flow():
     device_code_url = 'https://oauth2.googleapis.com/device/code'
     token_url = 'https://oauth2.googleapis.com/token'
 
-    r = requests.post(
+    r = _HTTP.post(
         device_code_url,
         data={
             'client_id': client_id,
@@ -280,7 +652,9 @@ def auth_device_flow():
     verification_url = dc.get('verification_url') or dc.get('verification_uri')
     user_code = dc['user_code']
     device_code = dc['device_code']
-    interval = int(dc.get('interval', 5))
+    # Poll no faster than the server asks (min 5s). slow_down must add at least 5s
+    # (RFC 8628 3.5): back off x1.5 capped at 30s, but never by less than +5s.
+    interval = max(float(dc.get('interval', 5)), 5.0)
     expires_in = int(dc.get('expires_in', 1800))
 
     print('\n[Google OAuth - Device Flow]')
@@ -290,12 +664,11 @@ def auth_device_flow():
     print(user_code)
     print('\nWaiting for authorization...')
 
-    import time
     deadline = time.time() + expires_in
     last_err = None
 
     while time.time() < deadline:
-        tr = requests.post(
+        tr = _HTTP.post(
             token_url,
             data={
                 'client_id': client_id,
@@ -328,14 +701,13 @@ def auth_device_flow():
             err = tr.text
         last_err = err
 
-        if err == 'authorization_pending':
-            time.sleep(interval)
-            continue
         if err == 'slow_down':
-            interval += 2
-            time.sleep(interval)
-            continue
-        raise RuntimeError(f'OAuth failed: {err} ({tr.text})')
+            interval = max(min(interval * 1.5, 30.0), interval + 5.0)
+        elif err != 'authorization_pending':
+            raise RuntimeError(f'OAuth failed: {err} ({tr.text})')
+        # Jitter (up to +20%, never below `interval`: RFC 8628 3.5) so several devices
+        # authorizing at once don't poll in lockstep
+        time.sleep(min(interval * random.uniform(1.0, 1.2), max(0.0, deadline - time.time())))
 
     raise RuntimeError(f'OAuth timed out. Last error: {last_err}')
 def auth():
@@ -361,10 +733,17 @@ def _button_state_write(state: dict) -> None:
     os.replace(tmp, BUTTON_STATE_PATH)
 
 
+def _json_loads(data: bytes):
+    """Parse a JSON document with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _cache_read(path: str) -> dict:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
+        with open(path, "rb") as f:
+            return _json_loads(f.read()) or {}
     except FileNotFoundError:
         return {}
     except Exception:
@@ -401,41 +780,61 @@ def cache_update() -> dict:
         "weather": {"ok": False},
     }
 
+    # The forecast fetch only waits on OpenWeather; run it alongside the calendar fetch.
+    ex = ThreadPoolExecutor(max_workers=1)
+    f_weather = ex.submit(_openweather_forecast_5d_3h)
+    ex.shutdown(wait=False)
+
     # Calendar cache (weeks + months)
     cal_payload: dict = {"updated_at": res["updated_at"], "weeks": {}, "months": {}}
 
+    # One range fetch (per-calendar GETs run concurrently) covering both weeks
+    # and both months, split locally
+    now = datetime.now().astimezone()
+    y, m = now.year, now.month
+    week_ranges = {which: _week_range(which) for which in ("this", "next")}
+    month_ranges = {
+        (yy, mm): _month_range(yy, mm) for yy, mm in [(y, m), (y + 1, 1) if m == 12 else (y, m + 1)]
+    }
+    spans = list(week_ranges.values()) + list(month_ranges.values())
+    fetch_error: Exception | None = None
+    try:
+        all_items = get_google_calendar_events_range(
+            min(a for a, _ in spans), max(b for _, b in spans)
+        )
+    except Exception as e:
+        all_items = []
+        fetch_error = e
+
+    def _within(start: datetime, end: datetime) -> list[tuple[datetime, str]]:
+        return [(dt, label) for dt, label in all_items if start <= dt < end]
+
     # Weeks: this week + next week
-    for which in ("this", "next"):
-        try:
-            start, end = _week_range(which)
-            items = get_google_calendar_events_range(start, end)
-            by_date: dict[str, list[str]] = {}
-            for dt, label in items:
-                k = dt.strftime("%m/%d(%a)")
-                by_date.setdefault(k, []).append(label)
-            cal_payload["weeks"][which] = {
-                "start": start.date().isoformat(),
-                "end": end.date().isoformat(),
-                "by_date": by_date,
-            }
-        except Exception as e:
-            cal_payload["weeks"][which] = {"error": str(e), "by_date": {}}
+    for which, (start, end) in week_ranges.items():
+        if fetch_error is not None:
+            cal_payload["weeks"][which] = {"error": str(fetch_error), "by_date": {}}
+            continue
+        by_date: dict[str, list[str]] = {}
+        for dt, label in _within(start, end):
+            k = dt.strftime("%m/%d(%a)")
+            by_date.setdefault(k, []).append(label)
+        cal_payload["weeks"][which] = {
+            "start": start.date().isoformat(),
+            "end": end.date().isoformat(),
+            "by_date": by_date,
+        }
 
     # Months: current + next month
-    now = datetime.now().astimezone()
-    y, m = now.year, now.month
-    months = [(y, m), (y + 1, 1) if m == 12 else (y, m + 1)]
-    for yy, mm in months:
+    for (yy, mm), (start, end) in month_ranges.items():
         key = f"{yy:04d}-{mm:02d}"
-        try:
-            schedules = get_google_calendar_events(yy, mm)
-            cal_payload["months"][key] = {
-                "year": yy,
-                "month": mm,
-                "schedules": schedules,
-            }
-        except Exception as e:
-            cal_payload["months"][key] = {"year": yy, "month": mm, "error": str(e), "schedules": {}}
+        if fetch_error is not None:
+            cal_payload["months"][key] = {"year": yy, "month": mm, "error": str(fetch_error), "schedules": {}}
+            continue
+        cal_payload["months"][key] = {
+            "year": yy,
+            "month": mm,
+            "schedules": _events_by_day(_within(start, end)),
+        }
 
     try:
         _cache_write(CACHE_CAL_PATH, cal_payload)
@@ -446,7 +845,7 @@ def cache_update() -> dict:
 
     # Weather cache (5-day forecast)
     try:
-        data = _openweather_forecast_5d_3h()
+        data = f_weather.result()
         rows = data.get("list", [])
         by_date: dict[str, list[dict]] = {}
         for r in rows:
@@ -463,7 +862,7 @@ def cache_update() -> dict:
             tmin = min(temps) if temps else None
             tmax = max(temps) if temps else None
 
-            descs = [((x.get("weather") or [{}])[0].get("description") or "") for x in day_rows]
+            descs = [_get_desc(x) for x in day_rows]
             descs = [d for d in descs if d]
             desc = max(set(descs), key=descs.count) if descs else ""
 
@@ -502,11 +901,10 @@ def render_week_from_cache(which: str = "this"):
 
     start, end = _week_range(which)
 
-    epd = _epd_init()
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_title = _font(font_path, 26)
-    font_day = _font(font_path, 20)
-    font_line = _font(font_path, 16)
+    epd = _epd()
+    font_title = _font(FONT_PATH, 26)
+    font_day = _font(FONT_PATH, 20)
+    font_line = _font(FONT_PATH, 16)
 
     Himage = Image.new("1", (epd.width, epd.height), 255)
     draw = ImageDraw.Draw(Himage)
@@ -537,8 +935,7 @@ def render_week_from_cache(which: str = "this"):
             y += 20
         y += 6
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Himage))
-    epd.sleep()
+    _epd_show(Himage)
 
 
 def render_month_from_cache(year: int | None = None, month: int | None = None):
@@ -569,10 +966,9 @@ def render_weather_week_from_cache():
         logging.warning("Weather cache missing/empty. Falling back to live API.")
         return render_weather_week()
 
-    epd = _epd_init()
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_title = _font(font_path, 26)
-    font_line = _font(font_path, 18)
+    epd = _epd()
+    font_title = _font(FONT_PATH, 26)
+    font_line = _font(FONT_PATH, 18)
 
     Himage = Image.new("1", (epd.width, epd.height), 255)
     draw = ImageDraw.Draw(Himage)
@@ -580,7 +976,7 @@ def render_weather_week_from_cache():
     updated_at = (payload.get("updated_at") or "").replace("T", " ")[:16]
     draw.text((20, 10), f"서울 5일 예보 (캐시:{updated_at})", font=font_title, fill=0)
 
-    y = 55
+    lines = []
     for d in days[:5]:
         k = d.get("label") or ""
         tmin = d.get("tmin")
@@ -592,11 +988,12 @@ def render_weather_week_from_cache():
         else:
             line = f"{k}  {desc}".strip()
 
-        draw.text((20, y), line[:40], font=font_line, fill=0)
-        y += 28
+        lines.append(line[:40])
+
+    draw.multiline_text((20, 55), "\n".join(lines), font=font_line, fill=0,
+                        spacing=_line_spacing(font_line, 28))
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Himage))
-    epd.sleep()
+    _epd_show(Himage)
 
 
 def _toggle_calendar_weather() -> str:
@@ -660,6 +1057,9 @@ def listen_button(gpio: int | None = None):
     Uses internal pull-up.
     """
 
+    global BACKGROUND_TOKEN_REFRESH
+    BACKGROUND_TOKEN_REFRESH = True  # long-lived: refresh tokens off the press path
+
     gpio = int(gpio or BUTTON_GPIO)
     logging.info("Button listener start (GPIO %d). Press to toggle calendar/weather.", gpio)
     _append_button_log(f"listener_start gpio={gpio}")
@@ -782,64 +1182,243 @@ def listen_button(gpio: int | None = None):
     pause()
 
 
-def _render_month_with_schedules(year: int, month: int, schedules: dict[int, list[str]]):
-    epd = _epd_init()
+# Leading time of a timed event label, e.g. '17:00 '
+_LEADING_TIME_RE = re.compile(r"^\d{1,2}:\d{2}\s*")
 
-    # Fonts
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_weekday = _font(font_path, 18)
-    font_day = _font(font_path, 20)
-    font_schedule = _font(font_path, 12)
 
-    WEEKDAYS = ["일", "월", "화", "수", "목", "금", "토"]
+def _clean_event(t: str) -> str:
+    """Strip the all-day marker and leading time from an event label for month cells."""
+    t = (t or "").replace("(종일)", "").strip()
+    return _LEADING_TIME_RE.sub("", t).strip()
 
-    Himage = Image.new("1", (epd.width, epd.height), 255)
-    Rimage = Image.new("1", (epd.width, epd.height), 255)
-    draw_black = ImageDraw.Draw(Himage)
-    draw_red = ImageDraw.Draw(Rimage)
 
-    margin_x = 20
-    margin_y = 5
-    cell_width = (epd.width - 2 * margin_x) // 7
-    cell_height = 87
-    weekday_height = 25
-
-    weekday_y = margin_y
-    for i, dayname in enumerate(WEEKDAYS):
-        x = margin_x + i * cell_width
-        if i == 0 or i == 6:
-            draw_red.text((x + 5, weekday_y), dayname, font=font_weekday, fill=0)
-        else:
-            draw_black.text((x + 5, weekday_y), dayname, font=font_weekday, fill=0)
+def _line_spacing(font_obj, pitch: int) -> int:
+    """multiline_text spacing that puts successive baselines `pitch` px apart.
+
+    Pillow advances each line by the height of "A" plus `spacing`.
+    """
+    return pitch - font_obj.getbbox("A", mode="1")[3]
+
+
+def _ruled_image(
+    size: tuple[int, int],
+    hlines: Iterable[tuple[int, int, int, int]] = (),
+    vlines: Iterable[tuple[int, int, int, int]] = (),
+) -> Image.Image:
+    """Return a white 1-bit image with black rules written as NumPy slice stores.
+
+    hlines are (y, x0, x1, width), vlines are (x, y0, y1, width). End points are
+    inclusive and a rule grows right/down from its coordinate, which matches
+    ImageDraw.line for the 1-2px widths used here. Out-of-range parts are clipped.
+    """
+    w, h = size
+    px = np.ones((h, w), dtype=bool)  # True = white
+    for y, x0, x1, width in hlines:
+        px[y : y + width, x0 : x1 + 1] = False
+    for x, y0, y1, width in vlines:
+        px[y0 : y1 + 1, x : x + width] = False
+    return Image.fromarray(px)
+
+
+def _truncate(draw_obj, font_obj, text: str, width: int) -> str:
+    """Cut ``text`` to fit ``width`` px, ending with an ellipsis when cut.
+
+    The cut point is estimated from the full text's average glyph width and then
+    corrected one character at a time, so only a few textlength calls are made.
+    """
+    if not text:
+        return ""
+    # fast path
+    try:
+        full_w = draw_obj.textlength(text, font=font_obj)
+        if full_w <= width:
+            return text
+    except Exception:
+        full_w = 7 * len(text)
 
-    line_y = weekday_y + weekday_height
-    draw_black.line((margin_x, line_y, epd.width - margin_x, line_y), fill=0, width=2)
+    ell = "…"
 
+    def _fits(n: int) -> bool:
+        cand = text[:n] + ell
+        try:
+            return draw_obj.textlength(cand, font=font_obj) <= width
+        except Exception:
+            return len(cand) <= max(1, width // 7)
+
+    cut = min(len(text), max(0, int(width * len(text) / full_w) - 1))
+    if _fits(cut):
+        while cut < len(text) and _fits(cut + 1):
+            cut += 1
+    else:
+        while cut > 0 and not _fits(cut):
+            cut -= 1
+    return text[:cut] + ell
+
+
+@lru_cache(maxsize=128)
+def _text_stamp(font_obj, text: str) -> tuple[Image.Image, tuple[int, int]]:
+    """Rasterize `text` once into a tight 1-bit mask plus its offset from the draw origin.
+
+    Pasting the mask with fill 0 gives the same pixels as draw.text(..., fill=0)
+    on a mode "1" image, without re-running glyph layout for repeated strings.
+    """
+    left, top, right, bottom = font_obj.getbbox(text, mode="1")
+    stamp = Image.new("1", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(stamp).text((-left, -top), text, font=font_obj, fill=1)
+    return stamp, (left, top)
+
+
+def _paste_text(img: Image.Image, xy: tuple[int, int], text: str, font_obj) -> None:
+    stamp, (dx, dy) = _text_stamp(font_obj, text)
+    img.paste(0, (xy[0] + dx, xy[1] + dy), stamp)
+
+
+# Month grid geometry, shared by the cached skeleton and the event overlay
+MONTH_WEEKDAYS = ["일", "월", "화", "수", "목", "금", "토"]
+MONTH_MARGIN_X = 20
+MONTH_MARGIN_Y = 5
+MONTH_CELL_HEIGHT = 87
+MONTH_WEEKDAY_HEIGHT = 25
+MONTH_LINE_Y = MONTH_MARGIN_Y + MONTH_WEEKDAY_HEIGHT
+MONTH_FONT_WEEKDAY_SIZE = 18
+MONTH_FONT_DAY_SIZE = 20
+
+# Part of the skeleton cache file names: changing the geometry or fonts above
+# makes old cached skeletons miss instead of loading stale layouts.
+MONTH_LAYOUT_KEY = hashlib.sha1(
+    repr(
+        (
+            MONTH_WEEKDAYS,
+            MONTH_MARGIN_X,
+            MONTH_MARGIN_Y,
+            MONTH_CELL_HEIGHT,
+            MONTH_WEEKDAY_HEIGHT,
+            FONT_PATH,
+            MONTH_FONT_WEEKDAY_SIZE,
+            MONTH_FONT_DAY_SIZE,
+        )
+    ).encode()
+).hexdigest()[:10]
+
+
+@lru_cache(maxsize=8)
+def _month_layout(year: int, month: int) -> tuple[tuple[tuple[int, ...], ...], dict[int, tuple[int, int]]]:
+    """Sunday-first weeks of the month (0 = padding) and day -> (week_num, day_num).
+
+    Cached and shared between callers: treat both as read-only.
+    """
     cal = py_calendar.Calendar(firstweekday=6)
-    month_days = cal.monthdayscalendar(year, month)
+    month_days = tuple(tuple(week) for week in cal.monthdayscalendar(year, month))
+    day_index = {
+        day: (week_num, day_num)
+        for week_num, week in enumerate(month_days)
+        for day_num, day in enumerate(week)
+        if day
+    }
+    return month_days, day_index
+
 
+@lru_cache(maxsize=4)
+def _weekday_strip(width: int) -> tuple[Image.Image, Image.Image]:
+    """Ink masks (1 = ink) of the weekday header for the black and red planes.
+
+    The header only depends on the panel width, so its seven labels are laid out
+    once and each skeleton gets them with one paste per plane.
+    """
+    font_weekday = _font(FONT_PATH, MONTH_FONT_WEEKDAY_SIZE)
+    cell_width = (width - 2 * MONTH_MARGIN_X) // 7
+    black = Image.new("1", (width, MONTH_LINE_Y), 0)
+    red = Image.new("1", (width, MONTH_LINE_Y), 0)
+    for i, dayname in enumerate(MONTH_WEEKDAYS):
+        x = MONTH_MARGIN_X + i * cell_width
+        stamp, (dx, dy) = _text_stamp(font_weekday, dayname)
+        target = red if i == 0 or i == 6 else black
+        target.paste(1, (x + 5 + dx, MONTH_MARGIN_Y + dy), stamp)
+    return black, red
+
+
+def _month_skeleton(year: int, month: int, size: tuple[int, int]) -> tuple[Image.Image, Image.Image]:
+    """Black/red planes with the weekday header, grid and day numbers of one month.
+
+    These depend only on (year, month, panel size) and the layout constants
+    (MONTH_LAYOUT_KEY), so they are stored in CACHEDIR as 1-bit PBM files and
+    reloaded on later renders; callers draw events on top.
+    """
+    w, h = size
+    base = os.path.join(CACHEDIR, f"month_skeleton_{MONTH_LAYOUT_KEY}_{year:04d}_{month:02d}_{w}x{h}")
+    paths = (f"{base}_black.pbm", f"{base}_red.pbm")
+    try:
+        planes = []
+        for path in paths:
+            with Image.open(path) as im:
+                planes.append(im.convert("1"))
+        return planes[0], planes[1]
+    except OSError:
+        pass  # missing or unreadable: rebuild below
+
+    font_day = _font(FONT_PATH, MONTH_FONT_DAY_SIZE)
+
+    cell_width = (w - 2 * MONTH_MARGIN_X) // 7
+    line_y = MONTH_LINE_Y
+
+    month_days, _ = _month_layout(year, month)
+
+    # Header rule + grid (fixed geometry) go straight into the black layer
+    grid_start_y = line_y
+    grid_end_y = line_y + len(month_days) * MONTH_CELL_HEIGHT
+    Himage = _ruled_image(
+        (w, h),
+        hlines=[(line_y, MONTH_MARGIN_X, w - MONTH_MARGIN_X, 2)]
+        + [
+            (line_y + i * MONTH_CELL_HEIGHT, MONTH_MARGIN_X, w - MONTH_MARGIN_X, 1)
+            for i in range(len(month_days) + 1)
+        ],
+        vlines=[(MONTH_MARGIN_X + i * cell_width, grid_start_y, grid_end_y, 1) for i in range(8)],
+    )
+    Rimage = Image.new("1", (w, h), 255)
+
+    strip_black, strip_red = _weekday_strip(w)
+    Himage.paste(0, (0, 0), strip_black)
+    Rimage.paste(0, (0, 0), strip_red)
+
+    # Day numbers: at most 31 distinct strings, rasterized once via _text_stamp
     start_y = line_y + 2
     for week_num, week in enumerate(month_days):
         for day_num, day in enumerate(week):
             if day == 0:
                 continue
-            day_str = str(day)
-            x = margin_x + day_num * cell_width + 3
-            y = start_y + week_num * cell_height + 2
-            if day_num == 0 or day_num == 6:
-                draw_red.text((x, y), day_str, font=font_day, fill=0)
-            else:
-                draw_black.text((x, y), day_str, font=font_day, fill=0)
+            x = MONTH_MARGIN_X + day_num * cell_width + 3
+            y = start_y + week_num * MONTH_CELL_HEIGHT + 2
+            target = Rimage if day_num == 0 or day_num == 6 else Himage
+            _paste_text(target, (x, y), str(day), font_day)
+
+    try:
+        os.makedirs(CACHEDIR, exist_ok=True)
+        for img, path in ((Himage, paths[0]), (Rimage, paths[1])):
+            tmp = f"{path}.tmp"
+            img.save(tmp, format="PPM")
+            os.replace(tmp, path)
+    except OSError as e:
+        logging.warning("Month skeleton cache write failed: %s", e)
+
+    return Himage, Rimage
 
-    # Grid
-    grid_start_y = line_y
-    grid_end_y = line_y + len(month_days) * cell_height
-    for i in range(8):
-        x = margin_x + i * cell_width
-        draw_black.line((x, grid_start_y, x, grid_end_y), fill=0)
-    for i in range(len(month_days) + 1):
-        y = line_y + i * cell_height
-        draw_black.line((margin_x, y, epd.width - margin_x, y), fill=0)
+
+def _render_month_with_schedules(year: int, month: int, schedules: dict[int, list[str]]):
+    epd = _epd()
+
+    font_schedule = _font(FONT_PATH, 12)
+
+    margin_x = MONTH_MARGIN_X
+    cell_width = (epd.width - 2 * margin_x) // 7
+    cell_height = MONTH_CELL_HEIGHT
+    start_y = MONTH_LINE_Y + 2
+
+    _, day_to_pos = _month_layout(year, month)
+
+    # Weekdays, grid and day numbers come from the per-month cached skeleton
+    Himage, Rimage = _month_skeleton(year, month, (epd.width, epd.height))
+    draw_black = ImageDraw.Draw(Himage)
 
     # Events
     for day, texts in (schedules or {}).items():
@@ -850,81 +1429,87 @@ def _render_month_with_schedules(year: int, month: int, schedules: dict[int, lis
             continue
 
         # locate day cell
-        for week_num, week in enumerate(month_days):
-            if day_i not in week:
+        pos = day_to_pos.get(day_i)
+        if pos is None:
+            continue
+        week_num, day_num = pos
+        x0 = margin_x + day_num * cell_width + 3
+        y0 = start_y + week_num * cell_height + 28
+
+        max_w = cell_width - 8
+
+        lines = []
+        for t in texts:
+            ct = _clean_event(t)
+            if not ct:
                 continue
-            day_num = week.index(day_i)
-            x0 = margin_x + day_num * cell_width + 3
-            y0 = start_y + week_num * cell_height + 28
-
-            max_w = cell_width - 8
-
-            def _clean_event(t: str) -> str:
-                t = (t or "").replace("(종일)", "").strip()
-                # remove leading time like '17:00 '
-                t = re.sub(r"^\d{1,2}:\d{2}\s*", "", t)
-                return t.strip()
-
-            def _truncate(draw_obj, font_obj, text: str, width: int) -> str:
-                if not text:
-                    return ""
-                # fast path
-                try:
-                    if draw_obj.textlength(text, font=font_obj) <= width:
-                        return text
-                except Exception:
-                    pass
-                ell = "…"
-                lo, hi = 0, len(text)
-                best = ""
-                while lo <= hi:
-                    mid = (lo + hi) // 2
-                    cand = text[:mid] + ell
-                    try:
-                        ok = draw_obj.textlength(cand, font=font_obj) <= width
-                    except Exception:
-                        ok = len(cand) <= max(1, width // 7)
-                    if ok:
-                        best = cand
-                        lo = mid + 1
-                    else:
-                        hi = mid - 1
-                return best or ell
-
-            lines = []
-            for t in texts:
-                ct = _clean_event(t)
-                if not ct:
-                    continue
-                lines.append(_truncate(draw_black, font_schedule, ct, max_w))
-                if len(lines) >= 3:
-                    break
+            lines.append(_truncate(draw_black, font_schedule, ct, max_w))
+            if len(lines) >= 3:
+                break
 
-            for i, line in enumerate(lines):
-                draw_black.text((x0, y0 + i * 16), line, font=font_schedule, fill=0)
+        if lines:
+            draw_black.multiline_text(
+                (x0, y0), "\n".join(lines), font=font_schedule, fill=0,
+                spacing=_line_spacing(font_schedule, 16),
+            )
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Rimage))
-    epd.sleep()
+    _epd_show(Himage, Rimage)
 
 
-def render_month(year: int | None = None, month: int | None = None):
+def render_month(
+    year: int | None = None,
+    month: int | None = None,
+    schedules: dict[int, list[str]] | None = None,
+):
+    """Render a month grid. Pass `schedules` to skip the calendar fetch (already fetched)."""
     now = datetime.now()
     year = year or now.year
     month = month or now.month
 
     logging.info("Render month %d-%02d", year, month)
 
-    try:
-        schedules = get_google_calendar_events(year, month)
-    except Exception as e:
-        logging.error("Google Calendar fetch failed: %s", e)
-        schedules = {}
+    if schedules is None:
+        try:
+            schedules = get_google_calendar_events(year, month)
+        except Exception as e:
+            logging.error("Google Calendar fetch failed: %s", e)
+            schedules = {}
 
     _render_month_with_schedules(year, month, schedules)
 
 
-def _openweather_forecast_5d_3h():
-    """Free forecast API (5 days / 3-hour steps)."""
+def _get_desc(row: dict) -> str:
+    """Description of the first `weather` entry of a forecast row ("" if absent)."""
+    w = row.get("weather")
+    return (w[0].get("description") or "") if w else ""
+
+
+def _forecast_from_entry(entry: dict, key: str, cnt: int | None) -> dict | None:
+    """Cached {"key", "cnt", "data"} entry usable for this request (sliced to cnt), else None."""
+    have = entry.get("cnt")  # None = full list
+    if entry.get("key") != key or not entry.get("data"):
+        return None
+    if have is not None and (cnt is None or have < cnt):
+        return None
+    data = entry["data"]
+    if cnt is not None:
+        data = {**data, "list": (data.get("list") or [])[:cnt]}
+    return data
+
+
+def _openweather_forecast_5d_3h(
+    cache_ttl: int = WEATHER_CACHE_TTL, cnt: int | None = None, fresh: bool = False
+):
+    """Free forecast API (5 days / 3-hour steps).
+
+    Responses are cached in memory and on disk for ``cache_ttl`` seconds;
+    upstream only refreshes the forecast about every 10 minutes. ``fresh=True``
+    skips both caches (the result still refreshes them).
+
+    ``cnt`` limits the number of 3-hour rows requested (None = all ~40). A
+    cached response with at least that many rows is reused, sliced to ``cnt``.
+    """
+    global _FORECAST_MEMO
     api_key = os.environ.get("OPENWEATHER_API_KEY")
     if not api_key:
         raise RuntimeError("Missing OPENWEATHER_API_KEY env var")
@@ -937,15 +1522,45 @@ def _openweather_forecast_5d_3h():
         "units": "metric",
         "lang": "kr",
     }
-    r = requests.get(url, params=params, timeout=15)
+    if cnt is not None:
+        params["cnt"] = cnt
+    # Cache key excludes the api key; a change of location/units/lang misses.
+    key = f"{params['lat']},{params['lon']},{params['units']},{params['lang']}"
+
+    if not fresh:
+        now = time.time()
+        if now - _FORECAST_MEMO.get("t", 0.0) < cache_ttl:
+            data = _forecast_from_entry(_FORECAST_MEMO, key, cnt)
+            if data is not None:
+                return data
+        try:
+            mtime = os.stat(CACHE_FORECAST_PATH).st_mtime
+        except OSError:
+            mtime = 0.0
+        if now - mtime < cache_ttl:
+            cached = _cache_read(CACHE_FORECAST_PATH)
+            data = _forecast_from_entry(cached, key, cnt)
+            if data is not None:
+                _FORECAST_MEMO = {**cached, "t": mtime}
+                return data
+
+    r = _HTTP.get(url, params=params, timeout=15)
     r.raise_for_status()
-    return r.json()
+    data = _json_loads(r.content)
+
+    entry = {"key": key, "cnt": cnt, "data": data}
+    _FORECAST_MEMO = {**entry, "t": time.time()}
+    try:
+        _cache_write(CACHE_FORECAST_PATH, entry)
+    except Exception as e:
+        logging.warning("Forecast cache write failed: %s", e)
+    return data
 
 
-def render_weather_week():
-    """Render a simple 5-day forecast (free tier)."""
+def render_weather_week(fresh: bool = False):
+    """Render a simple 5-day forecast (free tier). fresh=True bypasses the forecast cache."""
     logging.info("Render weather week (5-day forecast)")
-    data = _openweather_forecast_5d_3h()
+    data = _openweather_forecast_5d_3h(fresh=fresh)
     rows = data.get("list", [])
 
     # Group into local dates
@@ -958,17 +1573,16 @@ def render_weather_week():
     # Keep first 5 dates
     dates = list(by_date.keys())[:5]
 
-    epd = _epd_init()
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_title = _font(font_path, 26)
-    font_line = _font(font_path, 18)
+    epd = _epd()
+    font_title = _font(FONT_PATH, 26)
+    font_line = _font(FONT_PATH, 18)
 
     Himage = Image.new("1", (epd.width, epd.height), 255)
     draw = ImageDraw.Draw(Himage)
 
     draw.text((20, 10), "서울 5일 예보", font=font_title, fill=0)
 
-    y = 55
+    lines = []
     for k in dates:
         day_rows = by_date[k]
         temps = [x.get("main", {}).get("temp") for x in day_rows]
@@ -977,7 +1591,7 @@ def render_weather_week():
         tmax = max(temps) if temps else None
 
         # pick most frequent description
-        descs = [((x.get("weather") or [{}])[0].get("description") or "") for x in day_rows]
+        descs = [_get_desc(x) for x in day_rows]
         descs = [d for d in descs if d]
         w = max(set(descs), key=descs.count) if descs else ""
 
@@ -986,17 +1600,22 @@ def render_weather_week():
         else:
             line = f"{k}  {tmin:.0f}~{tmax:.0f}°C  {w}"
 
-        draw.text((20, y), line[:40], font=font_line, fill=0)
-        y += 28
+        lines.append(line[:40])
+
+    draw.multiline_text((20, 55), "\n".join(lines), font=font_line, fill=0,
+                        spacing=_line_spacing(font_line, 28))
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Himage))
-    epd.sleep()
+    _epd_show(Himage)
 
 
-def render_weather_hourly(day: str = "today"):
-    """Render hourly forecast using free 5d/3h endpoint (shows 3-hour steps)."""
+def render_weather_hourly(day: str = "today", fresh: bool = False):
+    """Render hourly forecast using free 5d/3h endpoint (shows 3-hour steps).
+
+    fresh=True bypasses the forecast cache.
+    """
     logging.info("Render weather hourly: %s", day)
-    data = _openweather_forecast_5d_3h()
+    # Rows start at the next 3h slot: 8 cover the next 24h, 16 reach the end of tomorrow.
+    data = _openweather_forecast_5d_3h(cnt=16 if day == "tomorrow" else 8, fresh=fresh)
     rows = data.get("list", [])
 
     now = datetime.now().astimezone()
@@ -1005,22 +1624,23 @@ def render_weather_hourly(day: str = "today"):
         start = (start + timedelta(days=1)).replace(hour=0)
     end = start + timedelta(hours=24)
 
-    pts = []
-    for r in rows:
-        t = datetime.fromtimestamp(r["dt"], tz=timezone.utc).astimezone()
-        if not (start <= t < end):
-            continue
-        temp = r.get("main", {}).get("temp")
-        w = (r.get("weather") or [{}])[0].get("description", "")
-        pts.append((t, temp, w))
-
-    # already 3-hour steps; show first 8
-    pts = pts[:8]
+    # Rows come sorted by dt in 3-hour steps: slice the window by timestamp
+    # and only build datetimes for the (at most 8) rows shown.
+    dts = [r["dt"] for r in rows]
+    lo = bisect.bisect_left(dts, start.timestamp())
+    hi = bisect.bisect_left(dts, end.timestamp())
+    pts = [
+        (
+            datetime.fromtimestamp(r["dt"], tz=timezone.utc).astimezone(),
+            r.get("main", {}).get("temp"),
+            _get_desc(r),
+        )
+        for r in rows[lo:hi][:8]
+    ]
 
-    epd = _epd_init()
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_title = _font(font_path, 26)
-    font_line = _font(font_path, 18)
+    epd = _epd()
+    font_title = _font(FONT_PATH, 26)
+    font_line = _font(FONT_PATH, 18)
 
     Himage = Image.new("1", (epd.width, epd.height), 255)
     draw = ImageDraw.Draw(Himage)
@@ -1028,16 +1648,15 @@ def render_weather_hourly(day: str = "today"):
     title = "서울 오늘 시간별(3시간)" if day == "today" else "서울 내일 시간별(3시간)"
     draw.text((20, 10), title, font=font_title, fill=0)
 
-    y = 60
-    for t, temp, w in pts:
-        if not isinstance(temp, (int, float)):
-            continue
-        line = f"{t.strftime('%H:%M')}  {temp:.0f}°C  {w}"
-        draw.text((20, y), line[:40], font=font_line, fill=0)
-        y += 30
+    lines = [
+        f"{t.strftime('%H:%M')}  {temp:.0f}°C  {w}"[:40]
+        for t, temp, w in pts
+        if isinstance(temp, (int, float))
+    ]
+    draw.multiline_text((20, 60), "\n".join(lines), font=font_line, fill=0,
+                        spacing=_line_spacing(font_line, 30))
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Himage))
-    epd.sleep()
+    _epd_show(Himage)
 
 
 def render_week(which: str = "this"):
@@ -1058,11 +1677,10 @@ def render_week(which: str = "this"):
         logging.error("Google Calendar fetch failed: %s", e)
         items = []
 
-    epd = _epd_init()
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_title = _font(font_path, 26)
-    font_day = _font(font_path, 20)
-    font_line = _font(font_path, 16)
+    epd = _epd()
+    font_title = _font(FONT_PATH, 26)
+    font_day = _font(FONT_PATH, 20)
+    font_line = _font(FONT_PATH, 16)
 
     Himage = Image.new("1", (epd.width, epd.height), 255)
     draw = ImageDraw.Draw(Himage)
@@ -1101,8 +1719,7 @@ def render_week(which: str = "this"):
             y += 20
         y += 6
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Himage))
-    epd.sleep()
+    _epd_show(Himage)
 
 
 
@@ -1130,9 +1747,14 @@ def render_week_with_weather(which: str = "this"):
 
     logging.info("Render 7d+weather: %s (%s..%s)", which, start.date(), end.date())
 
+    # Calendar + weather are independent network calls: fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_events = ex.submit(get_google_calendar_events_range, start, end)
+        f_weather = ex.submit(_openweather_forecast_5d_3h)
+
     # Events
     try:
-        items = get_google_calendar_events_range(start, end)
+        items = f_events.result()
     except Exception as e:
         logging.error("Google Calendar fetch failed: %s", e)
         items = []
@@ -1145,52 +1767,71 @@ def render_week_with_weather(which: str = "this"):
     # Weather (best-effort)
     weather_by_date: dict[date, tuple[int | None, int | None, str]] = {}
     try:
-        data = _openweather_forecast_5d_3h()
+        data = f_weather.result()
         rows = data.get("list", [])
-        tmp: dict[date, list[dict]] = {}
+        # One pass: per-day [min temp, max temp, description counts]
+        agg: dict[date, list] = {}
         for r in rows:
-            dt = datetime.fromtimestamp(r["dt"], tz=timezone.utc).astimezone()
-            tmp.setdefault(dt.date(), []).append(r)
+            d = datetime.fromtimestamp(r["dt"], tz=timezone.utc).astimezone().date()
+            a = agg.get(d)
+            if a is None:
+                a = agg[d] = [None, None, Counter()]
+            t = r.get("main", {}).get("temp")
+            if isinstance(t, (int, float)):
+                a[0] = t if a[0] is None else min(a[0], t)
+                a[1] = t if a[1] is None else max(a[1], t)
+            dsc = _get_desc(r)
+            if dsc:
+                a[2][dsc] += 1
 
         for i in range(7):
             d = (start + timedelta(days=i)).date()
-            day_rows = tmp.get(d) or []
-            temps = [x.get("main", {}).get("temp") for x in day_rows]
-            temps = [t for t in temps if isinstance(t, (int, float))]
-            tmin = int(min(temps)) if temps else None
-            tmax = int(max(temps)) if temps else None
-
-            descs = [((x.get("weather") or [{}])[0].get("description") or "") for x in day_rows]
-            descs = [dsc for dsc in descs if dsc]
-            desc = (max(set(descs), key=descs.count) if descs else "")
+            if d not in agg:
+                weather_by_date[d] = (None, None, "")
+                continue
+            lo, hi, counts = agg[d]
+            tmin = int(lo) if lo is not None else None
+            tmax = int(hi) if hi is not None else None
+            desc = counts.most_common(1)[0][0] if counts else ""
             weather_by_date[d] = (tmin, tmax, desc)
     except Exception as e:
         logging.warning("Weather fetch failed: %s", e)
 
-    epd = _epd_init()
+    epd = _epd()
     W, H = epd.width, epd.height
 
-    font_path = os.path.join(PICDIR, "Font.ttc")
-    font_title = _font(font_path, 30)
-    font_col = _font(font_path, 24)
-    font_day = _font(font_path, 24)
-    font_event = _font(font_path, 24)
-    font_weather = _font(font_path, 24)
-
-    # Two buffers: black + red
-    Himage = Image.new("1", (W, H), 255)  # black layer
-    Rimage = Image.new("1", (W, H), 255)  # red layer
-    draw = ImageDraw.Draw(Himage)
-    draw_r = ImageDraw.Draw(Rimage)
+    font_title = _font(FONT_PATH, 30)
+    font_col = _font(FONT_PATH, 24)
+    font_day = _font(FONT_PATH, 24)
+    font_event = _font(FONT_PATH, 24)
+    font_weather = _font(FONT_PATH, 24)
 
     # Layout constants
     margin = 10
     title_h = 52
     split_x = int(W * 0.72)  # make weather column narrower
     content_top = margin + title_h
+    header_line_y = content_top + 44
+    row_top = header_line_y
+    row_h = (H - row_top - margin) // 7
 
-    # Outer border (black)
-    draw.rectangle((0, 0, W - 1, H - 1), outline=0, width=2)
+    # Two buffers: black + red.
+    # Black layer starts with all rules: outer border, title/header lines,
+    # vertical split and the 7 row separators.
+    Himage = _ruled_image(
+        (W, H),
+        hlines=[
+            (0, 0, W - 1, 2),
+            (H - 2, 0, W - 1, 2),
+            (content_top, 0, W, 2),
+            (header_line_y, 0, W, 1),
+        ]
+        + [(row_top + (i + 1) * row_h, 0, W, 1) for i in range(7)],
+        vlines=[(0, 0, H - 1, 2), (W - 2, 0, H - 1, 2), (split_x, content_top, H, 2)],
+    )
+    Rimage = Image.new("1", (W, H), 255)  # red layer
+    draw = ImageDraw.Draw(Himage)
+    draw_r = ImageDraw.Draw(Rimage)
 
     # Title (red)
     title = "7일" if which == "this" else "다음 7일"
@@ -1200,27 +1841,16 @@ def render_week_with_weather(which: str = "this"):
         font=font_title,
         fill=0,
     )
-    draw.line((0, content_top, W, content_top), fill=0, width=2)
-
-    # Vertical split line
-    draw.line((split_x, content_top, split_x, H), fill=0, width=2)
 
     # Column headers (black)
     draw.text((margin, content_top + 10), "세부일정", font=font_col, fill=0)
     draw.text((split_x + margin, content_top + 10), "날씨", font=font_col, fill=0)
-    header_line_y = content_top + 44
-    draw.line((0, header_line_y, W, header_line_y), fill=0, width=1)
-
-    row_top = header_line_y
-    row_h = (H - row_top - margin) // 7
 
     kor_days = ["월", "화", "수", "목", "금", "토", "일"]
     today_date = now.date()
 
     for i in range(7):
         y0 = row_top + i * row_h
-        y1 = row_top + (i + 1) * row_h
-        draw.line((0, y1, W, y1), fill=0, width=1)
 
         d = (start + timedelta(days=i)).date()
         is_today = (d == today_date)
@@ -1251,8 +1881,7 @@ def render_week_with_weather(which: str = "this"):
 
         pen.text((split_x + margin, y0 + 3), wline[:18], font=font_weather, fill=0)
 
-    epd.display(epd.getbuffer(Himage), epd.getbuffer(Rimage))
-    epd.sleep()
+    _epd_show(Himage, Rimage)
 
 
 if __name__ == "__main__":
@@ -14,12 +14,52 @@ Use `python pi_calendar.py auth` once to generate it.
 
 from __future__ import annotations
 
-import os
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+
 from fastapi import FastAPI, HTTPException
 
-import pi_calendar
+# The panel is a single SPI device: renders run one at a time on one worker
+# thread, so the event loop stays free while a refresh takes several seconds.
+_RENDER_LOCK = asyncio.Lock()
+_EXEC = ThreadPoolExecutor(max_workers=1)
+
+
+@functools.lru_cache(maxsize=None)
+def _pc():
+    """pi_calendar, imported on first use.
+
+    It pulls in PIL, NumPy and google-auth; keeping that off the import path
+    lets uvicorn answer /health (and serve the docs) right away.
+    """
+    import pi_calendar
+
+    # The server outlives any token refresh: let it run in the background
+    pi_calendar.BACKGROUND_TOKEN_REFRESH = True
+    return pi_calendar
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Import on the render thread so the first render doesn't pay for it.
+    _EXEC.submit(_pc)
+    yield
 
-app = FastAPI(title="pi-calendar", version="0.1.0")
+
+app = FastAPI(title="pi-calendar", version="0.1.0", lifespan=_lifespan)
+
+
+def _call(name: str, kwargs: dict) -> None:
+    getattr(_pc(), name)(**kwargs)
+
+
+async def _render(name: str, **kwargs) -> None:
+    async with _RENDER_LOCK:
+        await asyncio.get_running_loop().run_in_executor(_EXEC, functools.partial(_call, name, kwargs))
 
 
 @app.get("/health")
@@ -28,51 +68,59 @@ def health():
 
 
 @app.post("/render/month")
-def render_month(month: int | None = None, year: int | None = None):
+async def render_month(month: int | None = None, year: int | None = None):
+    now = datetime.now()
+    y, m = year or now.year, month or now.month
+    try:
+        pc = await asyncio.to_thread(_pc)
+        schedules = await pc.get_google_calendar_events_async(y, m)
+    except Exception as e:
+        logging.error("Google Calendar fetch failed: %s", e)
+        schedules = {}
     try:
-        pi_calendar.render_month(year=year, month=month)
+        await _render("render_month", year=y, month=m, schedules=schedules)
         return {"ok": True, "mode": "month", "year": year, "month": month}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/render/week")
-def render_week(which: str = "this"):
+async def render_week(which: str = "this"):
     if which not in ("this", "next"):
         raise HTTPException(status_code=400, detail="which must be 'this' or 'next'")
     try:
-        pi_calendar.render_week(which=which)
+        await _render("render_week", which=which)
         return {"ok": True, "mode": "week", "which": which}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/render/week-weather")
-def render_week_weather(which: str = "this"):
+async def render_week_weather(which: str = "this"):
     if which not in ("this", "next"):
         raise HTTPException(status_code=400, detail="which must be 'this' or 'next'")
     try:
-        pi_calendar.render_week_with_weather(which=which)
+        await _render("render_week_with_weather", which=which)
         return {"ok": True, "mode": "week_weather", "which": which}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/render/weather/week")
-def render_weather_week():
+async def render_weather_week(fresh: bool = False):
     try:
-        pi_calendar.render_weather_week()
+        await _render("render_weather_week", fresh=fresh)
         return {"ok": True, "mode": "weather_week"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/render/weather/hourly")
-def render_weather_hourly(day: str = "today"):
+async def render_weather_hourly(day: str = "today", fresh: bool = False):
     if day not in ("today", "tomorrow"):
         raise HTTPException(status_code=400, detail="day must be 'today' or 'tomorrow'")
     try:
-        pi_calendar.render_weather_hourly(day=day)
+        await _render("render_weather_hourly", day=day, fresh=fresh)
         return {"ok": True, "mode": "weather_hourly", "day": day}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))